@@ -1,16 +1,92 @@
-import random
+import heapq
+import numpy as np
 import pygame
 from collections import deque
 import time
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+# Carving steps as parallel x/y offset arrays: Right, Down, Left, Up
+_CARVE_DX = np.array([0, 2, 0, -2], dtype=np.int32)
+_CARVE_DY = np.array([2, 0, -2, 0], dtype=np.int32)
+
+# Solver steps, shared by all instances; plain tuples index fastest from Python
+_DX = (0, 1, 0, -1)
+_DY = (1, 0, -1, 0)
+
+
+@njit(cache=True)
+def _carve_region(maze, x0, y0, x1, y1, seed):
+    """Carve passages between the cells of [x0, x1] x [y0, y1] with an iterative depth-first search"""
+    np.random.seed(seed)
+    order = np.arange(4)
+    # At most one stack entry per odd-coordinate cell
+    stack = np.empty((((x1 - x0) // 2 + 1) * ((y1 - y0) // 2 + 1), 2), dtype=np.int32)
+
+    # Start from the top-left cell; uncarved cells (walls) are the unvisited ones
+    maze[y0, x0] = 0
+    stack[0, 0] = x0
+    stack[0, 1] = y0
+    top = 1
+
+    while top > 0:
+        current_x = stack[top - 1, 0]
+        current_y = stack[top - 1, 1]
+
+        # Fisher-Yates shuffle of the direction order
+        for i in range(3, 0, -1):
+            j = np.random.randint(0, i + 1)
+            order[i], order[j] = order[j], order[i]
+
+        # Take the first unvisited neighbour in shuffled order
+        moved = False
+        for i in range(4):
+            dx, dy = _CARVE_DX[order[i]], _CARVE_DY[order[i]]
+            next_x, next_y = current_x + dx, current_y + dy
+            if x0 <= next_x <= x1 and y0 <= next_y <= y1 and maze[next_y, next_x] == 1:
+                # Remove the wall between current cell and chosen cell
+                maze[current_y + dy//2, current_x + dx//2] = 0
+                maze[next_y, next_x] = 0
+                stack[top, 0] = next_x
+                stack[top, 1] = next_y
+                top += 1
+                moved = True
+                break
+
+        if not moved:
+            top -= 1
+
+
+@njit(cache=True)
+def _carve(maze, h, w, seed):
+    """Carve passages into an all-wall grid with an iterative depth-first search"""
+    _carve_region(maze, 1, 1, w - 2, h - 2, seed)
+
+
+@njit(parallel=True, cache=True)
+def _carve_tiles(maze, bounds, seeds):
+    """Carve every (x0, y0, x1, y1) tile in bounds independently, in parallel"""
+    for t in prange(bounds.shape[0]):
+        _carve_region(maze, bounds[t, 0], bounds[t, 1], bounds[t, 2], bounds[t, 3], seeds[t])
+
+
 class MazeGenerator:
-    def __init__(self, width, height, difficulty='hard'):
+    def __init__(self, width, height, difficulty='hard', tiles=1):
         # Ensure odd dimensions for proper maze generation
         self.width = width if width % 2 == 1 else width + 1
         self.height = height if height % 2 == 1 else height + 1
-        self.maze = [[1 for _ in range(self.width)] for _ in range(self.height)]
+        self.maze = np.ones((self.height, self.width), dtype=np.uint8)
         self.difficulty = difficulty
-        self.directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]  # Right, Down, Left, Up
+        # Tiles per side carved in parallel; 1 carves the whole grid serially
+        self.tiles = max(1, min(tiles, (self.width - 1) // 2, (self.height - 1) // 2))
         
         # Difficulty settings affect the number of alternative paths
         self.extra_paths = {
@@ -21,41 +97,14 @@ class MazeGenerator:
 
     def generate_maze(self):
         # Initialize all cells as walls
-        for y in range(self.height):
-            for x in range(self.width):
-                self.maze[y][x] = 1
-
-        # Start from a random odd position
-        start_x = 1
-        start_y = 1
-        self.maze[start_y][start_x] = 0
+        self.maze.fill(1)
 
         # Generate the maze using depth-first search
-        stack = [(start_x, start_y)]
-        visited = set([(start_x, start_y)])
-
-        while stack:
-            current_x, current_y = stack[-1]
-            neighbors = []
-
-            # Check all possible directions
-            random.shuffle(self.directions)
-            for dx, dy in self.directions:
-                next_x, next_y = current_x + dx, current_y + dy
-                if (0 < next_x < self.width-1 and 0 < next_y < self.height-1 and 
-                    (next_x, next_y) not in visited):
-                    neighbors.append((next_x, next_y, dx, dy))
-
-            if neighbors:
-                # Choose a random unvisited neighbor
-                next_x, next_y, dx, dy = random.choice(neighbors)
-                # Remove the wall between current cell and chosen cell
-                self.maze[current_y + dy//2][current_x + dx//2] = 0
-                self.maze[next_y][next_x] = 0
-                stack.append((next_x, next_y))
-                visited.add((next_x, next_y))
-            else:
-                stack.pop()
+        if self.tiles == 1:
+            seed = np.random.randint(0, 2**31 - 1)
+            _carve(self.maze, self.height, self.width, seed)
+        else:
+            self._carve_tiled()
 
         # Add some random extra paths based on difficulty
         self._add_extra_paths()
@@ -65,25 +114,71 @@ class MazeGenerator:
         self._rotate_maze()  # Rotate the maze
         return self.maze
 
+    def _carve_tiled(self):
+        """Carve tiles of the grid in parallel, then join them into a single maze"""
+        # Split the cell columns and rows as evenly as possible
+        col_edges = np.linspace(0, (self.width - 1) // 2, self.tiles + 1).astype(np.int32)
+        row_edges = np.linspace(0, (self.height - 1) // 2, self.tiles + 1).astype(np.int32)
+
+        # Grid bounds of each tile, from its first to its last cell
+        bounds = np.empty((self.tiles * self.tiles, 4), dtype=np.int32)
+        for ty in range(self.tiles):
+            for tx in range(self.tiles):
+                bounds[ty * self.tiles + tx] = (2 * col_edges[tx] + 1, 2 * row_edges[ty] + 1,
+                                                2 * col_edges[tx + 1] - 1, 2 * row_edges[ty + 1] - 1)
+        seeds = np.random.randint(0, 2**31 - 1, size=len(bounds))
+        _carve_tiles(self.maze, bounds, seeds)
+
+        # Each tile is a spanning tree of its cells; open one wall across randomly
+        # chosen tile borders until union-find says all tiles are connected
+        borders = ([(t, t + 1) for t in range(len(bounds)) if t % self.tiles < self.tiles - 1] +
+                   [(t, t + self.tiles) for t in range(len(bounds) - self.tiles)])
+        parent = list(range(len(bounds)))
+
+        def find(t):
+            while parent[t] != t:
+                parent[t] = parent[parent[t]]
+                t = parent[t]
+            return t
+
+        for i in np.random.permutation(len(borders)):
+            a, b = borders[i]
+            root_a, root_b = find(a), find(b)
+            if root_a == root_b:
+                continue
+            parent[root_a] = root_b
+
+            x0, y0, x1, y1 = bounds[a]
+            if b == a + 1:
+                # Wall just right of tile a, on one of its rows
+                x = x1 + 1
+                y = 2 * np.random.randint((y0 - 1) // 2, (y1 - 1) // 2 + 1) + 1
+            else:
+                # Wall just below tile a, on one of its columns
+                x = 2 * np.random.randint((x0 - 1) // 2, (x1 - 1) // 2 + 1) + 1
+                y = y1 + 1
+            self.maze[y, x] = 0
+
     def _add_extra_paths(self):
         """Add additional paths based on difficulty level"""
         extra_paths_count = int((self.width * self.height) * self.extra_paths)
-        
-        for _ in range(extra_paths_count):
-            # Choose a random wall
-            x = random.randrange(2, self.width-2)
-            y = random.randrange(2, self.height-2)
-            
-            if self.maze[y][x] == 1:  # If it's a wall
-                # Check if removing this wall would connect two passages
-                passages = 0
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    if self.maze[y+dy][x+dx] == 0:
-                        passages += 1
-                
-                # If it connects exactly two passages, remove it
-                if passages >= 2:
-                    self.maze[y][x] = 0
+        if extra_paths_count == 0:
+            return
+
+        m = self.maze
+        # Count open 4-neighbours of every candidate wall in one pass
+        passages = ((m[1:-3, 2:-2] == 0).astype(np.int8) + (m[3:-1, 2:-2] == 0) +
+                    (m[2:-2, 1:-3] == 0) + (m[2:-2, 3:-1] == 0))
+
+        # Walls that connect at least two passages
+        candidates = np.argwhere((m[2:-2, 2:-2] == 1) & (passages >= 2))
+        if len(candidates) == 0:
+            return
+
+        # Remove a random sample of them in bulk
+        count = min(extra_paths_count, len(candidates))
+        chosen = candidates[np.random.choice(len(candidates), size=count, replace=False)]
+        m[chosen[:, 0] + 2, chosen[:, 1] + 2] = 0
 
     def _create_path(self, start, end):
         """Create a path between two points"""
@@ -95,95 +190,189 @@ class MazeGenerator:
         for i in range(steps + 1):
             x = start[0] + dx * i // steps
             y = start[1] + dy * i // steps
-            self.maze[y][x] = 0
+            self.maze[y, x] = 0
 
     def _set_start_end(self):
         """Set start and end points at opposite corners"""
         # Start at top-left
-        self.maze[1][1] = 2
+        self.maze[1, 1] = 2
         
         # End at bottom-right
-        self.maze[self.height-2][self.width-2] = 3
+        self.maze[self.height-2, self.width-2] = 3
         
         # Ensure there's a path to both points
-        self.maze[1][2] = 0
-        self.maze[2][1] = 0
-        self.maze[self.height-2][self.width-3] = 0
-        self.maze[self.height-3][self.width-2] = 0
+        self.maze[1, 2] = 0
+        self.maze[2, 1] = 0
+        self.maze[self.height-2, self.width-3] = 0
+        self.maze[self.height-3, self.width-2] = 0
+
+        # Remember the positions so the solver does not have to search for them
+        self.start = (1, 1)
+        self.end = (self.width-2, self.height-2)
 
     def _rotate_maze(self):
         """Rotate the maze 180 degrees"""
-        # Reverse the rows and columns
-        self.maze = [row[::-1] for row in self.maze[::-1]]
+        # Reverse the rows and columns into one fresh C-contiguous copy
+        self.maze = np.ascontiguousarray(self.maze[::-1, ::-1])
 
-        # Swap start and end points
-        self.maze[1][1], self.maze[self.height-2][self.width-2] = \
-            self.maze[self.height-2][self.width-2], self.maze[1][1]
+        # Swap start and end points back into their corners, so self.start
+        # and self.end stay valid
+        self.maze[1, 1], self.maze[self.height-2, self.width-2] = \
+            self.maze[self.height-2, self.width-2], self.maze[1, 1]
 
 class MazeSolver:
-    def __init__(self, maze):
+    def __init__(self, maze, start=None, end=None):
         self.maze = maze
-        self.height = len(maze)
-        self.width = len(maze[0])
-        self.directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        self.start = start
+        self.end = end
+        cells = np.asarray(maze, dtype=np.uint8)
+        self.height, self.width = cells.shape
+        # Flat row-major copy, indexed as grid[y * width + x]
+        self.grid = bytearray(cells.tobytes())
 
     def solve_dfs(self):
         start = self._find_start()
         end = self._find_end()
-        visited = set()
-        path = []
+        # Explicit stack of (x, y, next direction index) instead of recursion
+        stack = [(start[0], start[1], 0)]
+        parent = {start: None}
+        visited = bytearray(len(self.grid))
+        visited[start[1] * self.width + start[0]] = 1
         
-        def dfs(x, y):
+        while stack:
+            x, y, i = stack[-1]
             if (x, y) == end:
-                return True
+                return self._reconstruct_path(parent, end)
+            if i == len(_DX):
+                stack.pop()
+                continue
             
-            visited.add((x, y))
-            for dx, dy in self.directions:
-                new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < self.width and 0 <= new_y < self.height and 
-                    self.maze[new_y][new_x] != 1 and (new_x, new_y) not in visited):
-                    path.append((new_x, new_y))
-                    if dfs(new_x, new_y):
-                        return True
-                    path.pop()
-            return False
-        
-        path.append(start)
-        dfs(*start)
-        return path
+            stack[-1] = (x, y, i + 1)
+            dx, dy = _DX[i], _DY[i]
+            new_x, new_y = x + dx, y + dy
+            if 0 <= new_x < self.width and 0 <= new_y < self.height:
+                index = new_y * self.width + new_x
+                if self.grid[index] != 1 and not visited[index]:
+                    visited[index] = 1
+                    parent[(new_x, new_y)] = (x, y)
+                    stack.append((new_x, new_y, 0))
+        return [start]
 
     def solve_bfs(self):
         start = self._find_start()
         end = self._find_end()
-        queue = deque([(start, [start])])
-        visited = {start}
+        queue = deque([start])
+        parent = {start: None}
+        visited = bytearray(len(self.grid))
+        visited[start[1] * self.width + start[0]] = 1
         
         while queue:
-            (x, y), path = queue.popleft()
+            x, y = queue.popleft()
             if (x, y) == end:
-                return path
+                return self._reconstruct_path(parent, end)
+            
+            for dx, dy in zip(_DX, _DY):
+                new_x, new_y = x + dx, y + dy
+                if 0 <= new_x < self.width and 0 <= new_y < self.height:
+                    index = new_y * self.width + new_x
+                    if self.grid[index] != 1 and not visited[index]:
+                        visited[index] = 1
+                        parent[(new_x, new_y)] = (x, y)
+                        queue.append((new_x, new_y))
+        return []
+
+    def solve_astar(self):
+        start = self._find_start()
+        end = self._find_end()
+        goal_x, goal_y = end
+        # Manhattan distance is consistent on a unit-cost grid, so the path is optimal
+        open_list = [(abs(start[0] - goal_x) + abs(start[1] - goal_y), 0, start[0], start[1])]
+        g_score = {start: 0}
+        parent = {start: None}
+        counter = 1
+        
+        while open_list:
+            _, _, x, y = heapq.heappop(open_list)
+            if (x, y) == end:
+                return self._reconstruct_path(parent, end)
             
-            for dx, dy in self.directions:
+            g = g_score[(x, y)] + 1
+            for dx, dy in zip(_DX, _DY):
                 new_x, new_y = x + dx, y + dy
                 if (0 <= new_x < self.width and 0 <= new_y < self.height and 
-                    self.maze[new_y][new_x] != 1 and (new_x, new_y) not in visited):
-                    visited.add((new_x, new_y))
-                    new_path = path + [(new_x, new_y)]
-                    queue.append(((new_x, new_y), new_path))
+                    self.grid[new_y * self.width + new_x] != 1 and g < g_score.get((new_x, new_y), float('inf'))):
+                    g_score[(new_x, new_y)] = g
+                    parent[(new_x, new_y)] = (x, y)
+                    f = g + abs(new_x - goal_x) + abs(new_y - goal_y)
+                    heapq.heappush(open_list, (f, counter, new_x, new_y))
+                    counter += 1
+        return []
+
+    def solve_bidir_bfs(self):
+        start = self._find_start()
+        end = self._find_end()
+        if start == end:
+            return [start]
+        parent_fwd = {start: None}
+        parent_bwd = {end: None}
+        frontier_fwd = [start]
+        frontier_bwd = [end]
+        
+        while frontier_fwd and frontier_bwd:
+            # Grow the smaller frontier by one full layer
+            if len(frontier_fwd) <= len(frontier_bwd):
+                frontier_fwd, meet = self._expand_layer(frontier_fwd, parent_fwd, parent_bwd)
+            else:
+                frontier_bwd, meet = self._expand_layer(frontier_bwd, parent_bwd, parent_fwd)
+            
+            if meet is not None:
+                # Stitch start -> meet with the backward chain meet -> end
+                path = self._reconstruct_path(parent_fwd, meet)
+                node = parent_bwd[meet]
+                while node is not None:
+                    path.append(node)
+                    node = parent_bwd[node]
+                return path
         return []
 
+    def _expand_layer(self, frontier, parent, other_parent):
+        """Expand one BFS layer and return the next layer and a meeting node, if any"""
+        next_frontier = []
+        for x, y in frontier:
+            for dx, dy in zip(_DX, _DY):
+                new_x, new_y = x + dx, y + dy
+                if (0 <= new_x < self.width and 0 <= new_y < self.height and 
+                    self.grid[new_y * self.width + new_x] != 1 and (new_x, new_y) not in parent):
+                    parent[(new_x, new_y)] = (x, y)
+                    if (new_x, new_y) in other_parent:
+                        return next_frontier, (new_x, new_y)
+                    next_frontier.append((new_x, new_y))
+        return next_frontier, None
+
+    def _reconstruct_path(self, parent, end):
+        """Walk the parent chain back from end and return the path from start"""
+        path = []
+        node = end
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+        return path
+
     def _find_start(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.maze[y][x] == 2:
-                    return (x, y)
+        if self.start is not None:
+            return self.start
+        index = self.grid.find(2)
+        if index != -1:
+            return (index % self.width, index // self.width)
         return (1, 1)
 
     def _find_end(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.maze[y][x] == 3:
-                    return (x, y)
+        if self.end is not None:
+            return self.end
+        index = self.grid.find(3)
+        if index != -1:
+            return (index % self.width, index // self.width)
         return (self.width-2, self.height-2)
 
 class MazeVisualizer:
@@ -196,13 +385,26 @@ class MazeVisualizer:
             3: (255, 0, 0),      # End (red)
             4: (0, 0, 255),      # Solution path (blue)
         }
+        # Lookup table from cell value to RGB, for colouring whole grids at once
+        self.color_lut = np.array([self.colors[i] for i in range(len(self.colors))],
+                                  dtype=np.uint8)
         pygame.init()
         self.font = pygame.font.Font(None, 36)
+        # Rendered label surfaces, keyed by text
+        self._text_cache = {}
+
+    def _render_text(self, text):
+        """Render text once and reuse the surface on later frames"""
+        text_surface = self._text_cache.get(text)
+        if text_surface is None:
+            text_surface = self.font.render(text, True, (0, 0, 0))
+            self._text_cache[text] = text_surface
+        return text_surface
 
     def create_button(self, screen, text, position, size, color):
         button = pygame.Rect(position[0], position[1], size[0], size[1])
-        pygame.draw.rect(screen, color, button)
-        text_surface = self.font.render(text, True, (0, 0, 0))
+        screen.fill(color, button)
+        text_surface = self._render_text(text)
         text_rect = text_surface.get_rect(center=button.center)
         screen.blit(text_surface, text_rect)
         return button
@@ -221,7 +423,7 @@ class MazeVisualizer:
             screen.fill((255, 255, 255))
             
             # Draw title
-            title = self.font.render("Select Difficulty", True, (0, 0, 0))
+            title = self._render_text("Select Difficulty")
             title_rect = title.get_rect(center=(menu_width//2, 50))
             screen.blit(title, title_rect)
             
@@ -251,15 +453,35 @@ class MazeVisualizer:
         
         return None
 
+    def _render_maze(self, maze):
+        """Colour the whole maze onto an off-screen surface in one array operation"""
+        height, width = maze.shape
+        rgb = self.color_lut[maze]
+        # Scale every cell up to a cell_size x cell_size block
+        rgb = rgb.repeat(self.cell_size, axis=0).repeat(self.cell_size, axis=1)
+        surface = pygame.Surface((width * self.cell_size, height * self.cell_size))
+        # surfarray is indexed [x, y]
+        pygame.surfarray.blit_array(surface, rgb.swapaxes(0, 1))
+        return surface
+
     def visualize(self, maze, solution_path=None):
-        height, width = len(maze), len(maze[0])
+        height, width = maze.shape
         window_width = width * self.cell_size
         window_height = height * self.cell_size + 60  # Extra space for button
         screen = pygame.display.set_mode((window_width, window_height))
         pygame.display.set_caption("Maze Generator and Solver")
         
+        # Render the maze once; each frame only blits it
+        maze_surface = self._render_maze(maze)
+        
+        # Cell centres of the solution, drawn as a single polyline
+        half = self.cell_size // 2
+        solution_points = [(x * self.cell_size + half, y * self.cell_size + half)
+                           for x, y in solution_path or []]
+        
         show_solution = False
         solution_button = None
+        needs_redraw = True
         running = True
         
         while running:
@@ -269,27 +491,20 @@ class MazeVisualizer:
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if solution_button and solution_button.collidepoint(event.pos):
                         show_solution = not show_solution
+                        needs_redraw = True
+                if event.type == pygame.VIDEOEXPOSE:
+                    needs_redraw = True
             
-            screen.fill((255, 255, 255))
+            if not needs_redraw:
+                continue
+            needs_redraw = False
             
-            # Draw maze
-            for y in range(height):
-                for x in range(width):
-                    color = self.colors[maze[y][x]]
-                    pygame.draw.rect(screen, color, 
-                                   (x * self.cell_size, y * self.cell_size, 
-                                    self.cell_size, self.cell_size))
+            screen.fill((255, 255, 255))
+            screen.blit(maze_surface, (0, 0))
             
             # Draw solution path if show_solution is True
-            if show_solution and solution_path:
-                for i in range(len(solution_path) - 1):
-                    x1, y1 = solution_path[i]
-                    x2, y2 = solution_path[i + 1]
-                    pygame.draw.line(screen, self.colors[4],
-                                   (x1 * self.cell_size + self.cell_size // 2,
-                                    y1 * self.cell_size + self.cell_size // 2),
-                                   (x2 * self.cell_size + self.cell_size // 2,
-                                    y2 * self.cell_size + self.cell_size // 2), 2)
+            if show_solution and len(solution_points) > 1:
+                pygame.draw.lines(screen, self.colors[4], False, solution_points, 2)
             
             # Draw solution button
             button_text = "Hide Solution" if show_solution else "Show Solution"
@@ -321,8 +536,8 @@ def main():
     maze = generator.generate_maze()
     
     # Solve maze
-    solver = MazeSolver(maze)
-    solution_path = solver.solve_bfs()
+    solver = MazeSolver(maze, start=generator.start, end=generator.end)
+    solution_path = solver.solve_astar()
     
     # Adjust cell size based on maze size for better visualization
     cell_size = min(800 // max(width, height), 20)